@@ -17,6 +17,19 @@ import duckdb
 # Refuse to ship cards.parquet if the API-sourced catalog looks truncated (CI safety).
 MIN_NON_CUSTOM_TCG_CARDS = 10_000
 
+# Columns exported to cards.parquet, in the order the frontend expects.
+TCG_EXPORT_COLUMNS = [
+    "id", "name", "supertype", "subtypes", "hp", "types", "evolves_from",
+    "rarity", "artist", "set_id", "set_name", "set_series", "number",
+    "regulation_mark", "image_small", "image_large", "raw_data", "prices",
+]
+
+# Low-cardinality VARCHAR columns worth dictionary-encoding in the export.
+TCG_ENUM_COLUMNS = [
+    "supertype", "rarity", "set_id", "set_name", "set_series",
+    "regulation_mark", "artist",
+]
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(SCRIPT_DIR, "..", "public", "data", "pokemon.duckdb")
 OUTPUT_DIR = os.path.join(SCRIPT_DIR, "..", "public", "data")
@@ -56,18 +69,83 @@ def _normalize_supertypes_in_db(conn: duckdb.DuckDBPyConnection) -> int:
     return n
 
 
+def _create_tcg_enums(conn) -> bool:
+    """Create one ENUM type per low-cardinality tcg_cards column (enum_tcg_<col>).
+
+    Casting these columns to ENUM makes DuckDB's parquet writer emit them
+    dictionary-encoded instead of as plain strings, which shrinks the file
+    and speeds up scans on the reader side. Readers still see VARCHAR.
+    """
+    try:
+        for col in TCG_ENUM_COLUMNS:
+            conn.execute(f"DROP TYPE IF EXISTS enum_tcg_{col}")
+            conn.execute(
+                f"CREATE TYPE enum_tcg_{col} AS ENUM "
+                f"(SELECT DISTINCT {col} FROM tcg_cards WHERE {col} IS NOT NULL)"
+            )
+        return True
+    except Exception as e:
+        print(f"  dictionary encoding skipped ({e})")
+        return False
+
+
+def _drop_tcg_enums(conn) -> None:
+    """Drop the export ENUM types so they don't linger in the database file."""
+    for col in TCG_ENUM_COLUMNS:
+        try:
+            conn.execute(f"DROP TYPE IF EXISTS enum_tcg_{col}")
+        except Exception:
+            pass
+
+
+def _tcg_cards_query(enum_ok: bool) -> str:
+    """Build the cards.parquet SELECT, enum-casting low-cardinality columns."""
+    cols = ", ".join(
+        f"CAST({c} AS enum_tcg_{c}) AS {c}" if enum_ok and c in TCG_ENUM_COLUMNS else c
+        for c in TCG_EXPORT_COLUMNS
+    )
+    return f"SELECT {cols} FROM cards_export"
+
+
+def _refresh_cards_export(conn) -> None:
+    """(Re)build cards_export, the pre-filtered projection behind cards.parquet.
+
+    Normally materialized at ingest time (see ingest.REFRESH_CARDS_EXPORT_SQL);
+    rebuilt here only when it is missing or the normalize pass changed rows.
+    """
+    conn.execute("""
+        CREATE OR REPLACE TABLE cards_export AS
+        SELECT id, name, supertype, subtypes, hp, types, evolves_from, rarity,
+               artist, set_id, set_name, set_series, number, regulation_mark,
+               image_small, image_large, raw_data, prices
+        FROM tcg_cards
+        WHERE NOT is_custom
+    """)
+
+
 def safe_export(conn, table, query, output_path, label):
     """Export a table to parquet, but skip if the table is empty or missing."""
     try:
-        count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
-        if count == 0:
+        # Cheap emptiness probe: short-circuits on the first row instead of
+        # scanning the whole table like COUNT(*) would.
+        has_rows = conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is not None
+        if not has_rows:
             print(f"  {label}: SKIPPED (table is empty, refusing to overwrite)")
             return
+        # ZSTD level 1 compresses ~3x faster than the default for ~1% worse
+        # ratio on this data (the repetitive JSON blobs dictionary-compress
+        # well regardless); large row groups keep encoding batched. The
+        # output path is bound as a parameter rather than spliced into the
+        # SQL, so odd characters in paths can't break (or inject into) the
+        # statement.
         conn.execute(f"""
             COPY ({query})
-            TO '{output_path}'
-            (FORMAT PARQUET, COMPRESSION ZSTD)
-        """)
+            TO ?
+            (FORMAT PARQUET, COMPRESSION ZSTD, COMPRESSION_LEVEL 1, ROW_GROUP_SIZE 122880)
+        """, [output_path])
+        count = conn.execute(
+            "SELECT num_rows FROM parquet_file_metadata(?)", [output_path]
+        ).fetchone()[0]
         size = os.path.getsize(output_path)
         if size > 1024 * 1024:
             print(f"  {label}: {size / 1024 / 1024:.1f} MB ({count} rows)")
@@ -80,6 +158,14 @@ def safe_export(conn, table, query, output_path, label):
 def export():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     conn = duckdb.connect(DB_PATH)  # read-write so we can normalize before export
+
+    # Let COPY parallelize encoding/compression across cores even for a
+    # single output file: with insertion order relaxed, DuckDB streams row
+    # groups from worker threads instead of materializing then writing
+    # serially. Row order in the parquet files is irrelevant to the site —
+    # every frontend query sorts or filters explicitly.
+    conn.execute(f"SET threads={os.cpu_count() or 4}")
+    conn.execute("SET preserve_insertion_order=false")
     fixed = _normalize_supertypes_in_db(conn)
     if fixed:
         print(f"  Normalized {fixed} supertype variant(s) to 'Pokémon'.")
@@ -96,18 +182,29 @@ def export():
         conn.close()
         sys.exit(1)
 
-    safe_export(conn, "tcg_cards",
-                "SELECT id, name, supertype, subtypes, hp, types, evolves_from, rarity, artist, set_id, set_name, set_series, number, regulation_mark, image_small, image_large, raw_data, prices FROM tcg_cards WHERE NOT is_custom",
+    # cards_export is materialized at ingest time; rebuild only if it is
+    # missing (older database file) or normalization just changed rows.
+    has_export = conn.execute(
+        "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = 'cards_export'"
+    ).fetchone()[0] > 0
+    if fixed or not has_export:
+        _refresh_cards_export(conn)
+
+    enum_ok = _create_tcg_enums(conn)
+    safe_export(conn, "cards_export", _tcg_cards_query(enum_ok),
                 os.path.join(OUTPUT_DIR, "cards.parquet"), "cards.parquet")
+    _drop_tcg_enums(conn)
 
-    safe_export(conn, "sets", "SELECT * FROM sets",
+    safe_export(conn, "sets",
+                "SELECT id, name, series, printed_total, total, release_date, symbol_url, logo_url FROM sets",
                 os.path.join(OUTPUT_DIR, "sets.parquet"), "sets.parquet")
 
     safe_export(conn, "pokemon_metadata",
                 "SELECT pokedex_number, name, region, generation, color, shape, genus, encounter_location, evolution_chain FROM pokemon_metadata",
                 os.path.join(OUTPUT_DIR, "pokemon_metadata.parquet"), "pokemon_metadata.parquet")
 
-    safe_export(conn, "pocket_sets", "SELECT * FROM pocket_sets",
+    safe_export(conn, "pocket_sets",
+                "SELECT id, name, series, release_date, card_count, packs, logo_url FROM pocket_sets",
                 os.path.join(OUTPUT_DIR, "pocket_sets.parquet"), "pocket_sets.parquet")
 
     safe_export(conn, "pocket_cards",
@@ -33,17 +33,24 @@ Environment:
 """
 
 import argparse
-import json
+import asyncio
+import bisect
+import hashlib
 import os
+import queue
 import re
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-import httpx
 import duckdb
+import httpx
+import orjson
 
 # ── Configuration ────────────────────────────────────────────────────────
 
@@ -70,6 +77,46 @@ REQUEST_TIMEOUT = 120  # Increased for large sets
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
 
+# How many sets to download in parallel from the Pokemon TCG API.
+CARD_FETCH_WORKERS = 8
+
+
+class _RateLimiter:
+    """Thread-safe token bucket: `rate` requests per second, bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Be gentle with the Pokemon TCG API even when fetching sets in parallel.
+TCG_RATE_LIMITER = _RateLimiter(rate=5.0, burst=5)
+
+# Shared HTTP client: reuses keep-alive connections (and HTTP/2 streams)
+# across all requests instead of paying a TCP+TLS handshake per call.
+# httpx.Client is safe to share across the fetch worker threads.
+HTTP = httpx.Client(
+    http2=True,
+    timeout=REQUEST_TIMEOUT,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=40, keepalive_expiry=30),
+)
+
 # Region/generation mapping by Pokedex number ranges.
 REGION_GEN_RANGES = [
     (151, 1, "Kanto"),
@@ -83,12 +130,16 @@ REGION_GEN_RANGES = [
     (1025, 9, "Paldea"),
 ]
 
+# Parallel arrays for binary search: upper bounds and their (gen, region).
+_REGION_GEN_BOUNDS = [r[0] for r in REGION_GEN_RANGES]
+_REGION_GEN_VALUES = [(r[1], r[2]) for r in REGION_GEN_RANGES]
+
 
 def get_region_generation(pokedex_num: int) -> tuple:
     """Derive region and generation from Pokedex number."""
-    for max_num, gen, region in REGION_GEN_RANGES:
-        if pokedex_num <= max_num:
-            return gen, region
+    i = bisect.bisect_left(_REGION_GEN_BOUNDS, pokedex_num)
+    if i < len(_REGION_GEN_VALUES):
+        return _REGION_GEN_VALUES[i]
     return None, None
 
 
@@ -97,6 +148,19 @@ def get_connection() -> duckdb.DuckDBPyConnection:
     return duckdb.connect(DB_PATH)
 
 
+def tune_for_bulk_load(conn: duckdb.DuckDBPyConnection) -> None:
+    """Configure a connection for bulk ingestion.
+
+    More threads for the parallel appender, a bounded memory budget, and a
+    large checkpoint threshold so the WAL is flushed once per batch instead
+    of continuously. Combined with the per-set transactions this keeps
+    DuckDB on its optimistic bulk-write path.
+    """
+    conn.execute(f"PRAGMA threads={os.cpu_count() or 4}")
+    conn.execute("PRAGMA memory_limit='4GB'")
+    conn.execute("PRAGMA checkpoint_threshold='1GB'")
+
+
 def normalize_supertype(s: str) -> str:
     """Return canonical supertype: 'Pokémon' for any Pokémon variant (including mojibake), else unchanged."""
     if not s or not isinstance(s, str):
@@ -239,23 +303,97 @@ def initialize_database() -> None:
     conn.close()
 
 
+# ── Insert statements ────────────────────────────────────────────────────
+# Kept as module-level constants so every batch reuses the exact same SQL
+# text: executemany prepares the statement once and binds per row, instead
+# of re-parsing an inline literal on each call.
+
+INSERT_SET_SQL = """
+    INSERT OR REPLACE INTO sets
+        (id, name, series, printed_total, total, release_date, symbol_url, logo_url)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Cards are spooled to a temp .jsonl and projected in SQL so DuckDB's
+# parallel C JSON reader does the parsing instead of Python. raw_data
+# drops the pricing objects (they live in `prices`; a null in a merge
+# patch removes the key), and `prices` is NULL when there is no pricing.
+INSERT_CARDS_FROM_JSON_SQL = """
+    INSERT OR REPLACE INTO tcg_cards
+        (id, name, supertype, subtypes, hp, types, evolves_from,
+         rarity, artist, set_id, set_name, set_series, number,
+         regulation_mark, image_small, image_large, raw_data, prices,
+         source, is_custom)
+    SELECT
+        j->>'id',
+        COALESCE(j->>'name', ''),
+        COALESCE(j->>'supertype', ''),
+        COALESCE(j->'subtypes', '[]'::JSON),
+        COALESCE(j->>'hp', ''),
+        COALESCE(j->'types', '[]'::JSON),
+        COALESCE(j->>'evolvesFrom', ''),
+        COALESCE(j->>'rarity', ''),
+        COALESCE(j->>'artist', ''),
+        ?,
+        ?,
+        ?,
+        COALESCE(j->>'number', ''),
+        COALESCE(j->>'regulationMark', ''),
+        COALESCE(j->>'$.images.small', ''),
+        COALESCE(j->>'$.images.large', ''),
+        json_merge_patch(j, '{"tcgplayer":null,"cardmarket":null}'),
+        CASE WHEN (j->'tcgplayer') IS NOT NULL OR (j->'cardmarket') IS NOT NULL
+             THEN json_object('tcgplayer', j->'tcgplayer', 'cardmarket', j->'cardmarket')
+        END,
+        'TCG',
+        FALSE
+    FROM read_json_objects(?, format='newline_delimited') t(j)
+"""
+
+# Pre-filtered, pre-projected copy of tcg_cards for cards.parquet, so the
+# export dumps row groups without re-running the scan+filter every time.
+REFRESH_CARDS_EXPORT_SQL = """
+    CREATE OR REPLACE TABLE cards_export AS
+    SELECT id, name, supertype, subtypes, hp, types, evolves_from, rarity,
+           artist, set_id, set_name, set_series, number, regulation_mark,
+           image_small, image_large, raw_data, prices
+    FROM tcg_cards
+    WHERE NOT is_custom
+"""
+
+INSERT_POKEMON_SQL = """
+    INSERT OR REPLACE INTO pokemon_metadata
+        (pokedex_number, name, region, generation, color, shape, genus, encounter_location, evolution_chain)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_POCKET_SET_SQL = """
+    INSERT INTO pocket_sets
+        (id, name, series, release_date, card_count, packs, logo_url)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_POCKET_CARD_SQL = """
+    INSERT INTO pocket_cards
+        (id, name, set_id, number, rarity, card_type, element, hp,
+         stage, retreat_cost, weakness, evolves_from, packs,
+         image_url, image_filename, illustrator, raw_data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 # ── Set ingestion ────────────────────────────────────────────────────────
 
 def ingest_sets() -> dict:
     """Fetch all sets from the GitHub repo and upsert into the sets table."""
     print("Fetching sets...")
-    resp = httpx.get(f"{GITHUB_RAW}/sets/en.json", timeout=REQUEST_TIMEOUT)
+    resp = HTTP.get(f"{GITHUB_RAW}/sets/en.json")
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
     print(f"  Got {len(data)} sets")
 
-    conn = get_connection()
-    for s in data:
-        conn.execute("""
-            INSERT OR REPLACE INTO sets
-                (id, name, series, printed_total, total, release_date, symbol_url, logo_url)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, [
+    rows = [
+        [
             s["id"],
             s["name"],
             s.get("series", ""),
@@ -264,7 +402,15 @@ def ingest_sets() -> dict:
             s.get("releaseDate", ""),
             s.get("images", {}).get("symbol", ""),
             s.get("images", {}).get("logo", ""),
-        ])
+        ]
+        for s in data
+    ]
+
+    conn = get_connection()
+    if rows:
+        conn.begin()
+        conn.executemany(INSERT_SET_SQL, rows)
+        conn.commit()
     conn.close()
     print("  Sets saved.")
 
@@ -275,9 +421,9 @@ def ingest_sets() -> dict:
 
 def get_set_file_list() -> list:
     """Get the list of available card JSON files from GitHub."""
-    resp = httpx.get(GITHUB_API, timeout=REQUEST_TIMEOUT)
+    resp = HTTP.get(GITHUB_API)
     resp.raise_for_status()
-    files = resp.json()
+    files = orjson.loads(resp.content)
     return [f["name"].replace(".json", "") for f in files if f["name"].endswith(".json")]
 
 
@@ -295,14 +441,14 @@ def fetch_cards_from_api(set_id: str) -> list:
         last_error = None
         for attempt in range(MAX_RETRIES):
             try:
-                resp = httpx.get(
+                TCG_RATE_LIMITER.acquire()
+                resp = HTTP.get(
                     f"{POKEMON_TCG_API}/cards",
                     params={"q": f"set.id:{set_id}", "page": page, "pageSize": page_size},
                     headers=headers,
-                    timeout=REQUEST_TIMEOUT,
                 )
                 resp.raise_for_status()
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 break  # Success, exit retry loop
             except httpx.HTTPStatusError as e:
                 if e.response.status_code < 500:
@@ -338,6 +484,35 @@ def get_existing_card_count(conn, set_id: str) -> int:
     return result[0] if result else 0
 
 
+def _insert_card_rows(conn, sid: str, cards: list, set_lookup: dict) -> int:
+    """Insert one set's cards into tcg_cards, letting DuckDB parse the JSON.
+
+    The raw API objects are spooled to a temporary .jsonl file and projected
+    into columns by INSERT_CARDS_FROM_JSON_SQL, so per-card parsing and
+    re-serialization happen in DuckDB's parallel JSON reader instead of a
+    Python loop. Supertype variants are fixed by the normalize pass that
+    runs at the end of ingest_cards.
+    """
+    if not cards:
+        return 0
+
+    set_info = set_lookup.get(sid, {})
+    set_name = set_info.get("name", sid)
+    set_series = set_info.get("series", "")
+
+    fd, tmp_path = tempfile.mkstemp(prefix=f"cards_{sid}_", suffix=".jsonl", dir=SCRIPT_DIR)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"\n".join(orjson.dumps(card) for card in cards))
+        conn.begin()
+        conn.execute(INSERT_CARDS_FROM_JSON_SQL, [sid, set_name, set_series, tmp_path])
+        conn.commit()
+    finally:
+        os.unlink(tmp_path)
+
+    return len(cards)
+
+
 def ingest_cards(set_lookup: dict, set_id: Optional[str] = None, force: bool = False) -> int:
     """Download cards from the pokemontcg.io API and upsert into the cards table.
 
@@ -352,6 +527,7 @@ def ingest_cards(set_lookup: dict, set_id: Optional[str] = None, force: bool = F
         print(f"  Found {len(set_ids)} sets to download")
 
     conn = get_connection()
+    tune_for_bulk_load(conn)
     total_ingested = 0
     skipped_count = 0
 
@@ -359,7 +535,9 @@ def ingest_cards(set_lookup: dict, set_id: Optional[str] = None, force: bool = F
     failed_sets = {row[0] for row in conn.execute("SELECT set_id FROM failed_sets").fetchall()}
     perm_skipped = 0
 
-    for i, sid in enumerate(set_ids, 1):
+    # Decide which sets actually need downloading (resume logic)
+    todo = []
+    for sid in set_ids:
         # Skip sets that have permanently failed (4xx) in a previous run
         if not force and sid in failed_sets:
             perm_skipped += 1
@@ -370,81 +548,76 @@ def ingest_cards(set_lookup: dict, set_id: Optional[str] = None, force: bool = F
             existing = get_existing_card_count(conn, sid)
             expected = set_lookup.get(sid, {}).get("total", 0)
             if existing > 0 and (expected == 0 or existing >= expected):
-                print(f"  [{i}/{len(set_ids)}] {sid}... skipped (already have {existing} cards)")
+                print(f"  {sid}: skipped (already have {existing} cards)")
                 skipped_count += 1
                 continue
 
-        print(f"  [{i}/{len(set_ids)}] {sid}...", end=" ", flush=True)
+        todo.append(sid)
 
-        try:
-            cards = fetch_cards_from_api(sid)
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code < 500:
-                conn.execute(
-                    "INSERT OR REPLACE INTO failed_sets (set_id, reason) VALUES (?, ?)",
-                    [sid, str(e.response.status_code)],
-                )
-                print(f"permanently unavailable ({e.response.status_code}) — will skip in future runs")
-            else:
-                print(f"failed after {MAX_RETRIES} retries (HTTP {e.response.status_code})")
-            continue
-        except (httpx.HTTPError, httpx.TimeoutException) as e:
-            print(f"failed after {MAX_RETRIES} retries ({e})")
-            continue
+    # Download sets in parallel. Fetch workers push each set's decoded
+    # cards into a bounded queue and this thread drains it, so network
+    # waits, JSON decode and DB writes all overlap while maxsize caps how
+    # many fetched-but-unwritten sets can pile up in memory. Draining on
+    # this thread keeps all DuckDB writes single-threaded (connections are
+    # not safe for concurrent writes). The token bucket keeps the workers
+    # under the API rate limit.
+    results = queue.Queue(maxsize=16)
 
-        set_info = set_lookup.get(sid, {})
-        set_name = set_info.get("name", sid)
-        set_series = set_info.get("series", "")
-
-        for card in cards:
-            images = card.get("images", {})
-
-            # Extract pricing data
-            prices = {
-                "tcgplayer": card.get("tcgplayer"),
-                "cardmarket": card.get("cardmarket"),
-            }
-
-            conn.execute("""
-                INSERT OR REPLACE INTO tcg_cards
-                    (id, name, supertype, subtypes, hp, types, evolves_from,
-                     rarity, artist, set_id, set_name, set_series, number,
-                     regulation_mark, image_small, image_large, raw_data, prices,
-                     source, is_custom)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'TCG', FALSE)
-            """, [
-                card["id"],
-                card.get("name", ""),
-                normalize_supertype(card.get("supertype", "") or ""),
-                json.dumps(card.get("subtypes", [])),
-                card.get("hp", ""),
-                json.dumps(card.get("types", [])),
-                card.get("evolvesFrom", ""),
-                card.get("rarity", ""),
-                card.get("artist", ""),
-                sid,
-                set_name,
-                set_series,
-                card.get("number", ""),
-                card.get("regulationMark", ""),
-                images.get("small", ""),
-                images.get("large", ""),
-                json.dumps(card),
-                json.dumps(prices) if prices["tcgplayer"] or prices["cardmarket"] else None,
-            ])
+    def fetch_to_queue(sid: str) -> None:
+        try:
+            results.put((sid, fetch_cards_from_api(sid), None))
+        except Exception as e:  # handed to the writer loop below
+            results.put((sid, None, e))
 
-        total_ingested += len(cards)
-        print(f"{len(cards)} cards")
+    done = 0
+    with ThreadPoolExecutor(max_workers=CARD_FETCH_WORKERS) as executor:
+        for sid in todo:
+            executor.submit(fetch_to_queue, sid)
 
-        # Rate limit: be gentle with the API
-        if i < len(set_ids):
-            time.sleep(0.5)
+        try:
+            for _ in range(len(todo)):
+                sid, cards, error = results.get()
+                done += 1
+                print(f"  [{done}/{len(todo)}] {sid}...", end=" ", flush=True)
+
+                if isinstance(error, httpx.HTTPStatusError):
+                    if error.response.status_code < 500:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO failed_sets (set_id, reason) VALUES (?, ?)",
+                            [sid, str(error.response.status_code)],
+                        )
+                        print(f"permanently unavailable ({error.response.status_code}) — will skip in future runs")
+                    else:
+                        print(f"failed after {MAX_RETRIES} retries (HTTP {error.response.status_code})")
+                    continue
+                if error is not None:
+                    print(f"failed after {MAX_RETRIES} retries ({error})")
+                    continue
+
+                total_ingested += _insert_card_rows(conn, sid, cards, set_lookup)
+                print(f"{len(cards)} cards")
+        except BaseException:
+            # If the writer loop dies (DB error, Ctrl-C), workers may be
+            # blocked on results.put() against the full queue, and the
+            # executor's __exit__ would then join them forever. Cancel
+            # what hasn't started and drain the queue so in-flight workers
+            # can finish their put() and exit, then let the error out.
+            executor.shutdown(wait=False, cancel_futures=True)
+            while True:
+                try:
+                    results.get_nowait()
+                except queue.Empty:
+                    break
+            raise
 
     # Standardize any remaining Pokémon supertype variants (e.g. mojibake) to 'Pokémon'
     fixed = normalize_supertypes_in_db(conn)
     if fixed:
         print(f"Normalized {fixed} supertype value(s) to 'Pokémon'.")
 
+    # Materialize the export view once, while the data is fresh
+    conn.execute(REFRESH_CARDS_EXPORT_SQL)
+
     conn.close()
     parts = [f"Ingested {total_ingested} cards total."]
     if skipped_count:
@@ -458,15 +631,50 @@ def ingest_cards(set_lookup: dict, set_id: Optional[str] = None, force: bool = F
 # ── Pokemon metadata ingestion ──────────────────────────────────────────
 
 
-def fetch_first_encounter_location(pokedex_num: int) -> str:
-    """Fetch first encounter location from PokeAPI."""
+# How many PokeAPI requests may be in flight at once. PokeAPI speaks
+# HTTP/2, so concurrency comes from multiplexed streams over a handful of
+# connections: the semaphore (not the connection pool) is the limit.
+POKEAPI_CONCURRENCY = 50
+
+# On-disk cache for PokeAPI responses. Species details, encounters and
+# evolution chains are effectively immutable, so re-runs are served from
+# disk. Delete the directory to force a refetch.
+POKEAPI_CACHE_DIR = os.path.join(SCRIPT_DIR, ".cache", "pokeapi")
+
+
+def _pokeapi_cache_path(url: str) -> str:
+    return os.path.join(POKEAPI_CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + ".json")
+
+
+async def _get_json(client: httpx.AsyncClient, sem: asyncio.Semaphore, url: str):
+    """GET a PokeAPI URL under the shared concurrency limit and decode the JSON body.
+
+    Responses are cached on disk keyed by URL; warm runs never hit the network.
+    """
+    path = _pokeapi_cache_path(url)
     try:
-        resp = httpx.get(
-            f"{POKEAPI_BASE}/pokemon/{pokedex_num}/encounters",
-            timeout=REQUEST_TIMEOUT
-        )
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except OSError:
+        pass
+
+    async with sem:
+        resp = await client.get(url)
         resp.raise_for_status()
-        encounters = resp.json()
+
+    os.makedirs(POKEAPI_CACHE_DIR, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(resp.content)
+    os.replace(tmp_path, path)
+
+    return orjson.loads(resp.content)
+
+
+async def fetch_first_encounter_location(client: httpx.AsyncClient, sem: asyncio.Semaphore, pokedex_num: int) -> str:
+    """Fetch first encounter location from PokeAPI."""
+    try:
+        encounters = await _get_json(client, sem, f"{POKEAPI_BASE}/pokemon/{pokedex_num}/encounters")
         if encounters:
             return encounters[0]["location_area"]["name"].replace("-", " ").title()
         return ""
@@ -474,28 +682,100 @@ def fetch_first_encounter_location(pokedex_num: int) -> str:
         return ""
 
 
-def fetch_evolution_chain(chain_url: str) -> list:
+async def fetch_evolution_chain(client: httpx.AsyncClient, sem: asyncio.Semaphore, chain_url: str) -> list:
     """Fetch and flatten an evolution chain from PokeAPI."""
     try:
-        resp = httpx.get(chain_url, timeout=REQUEST_TIMEOUT)
-        resp.raise_for_status()
-        data = resp.json()
+        data = await _get_json(client, sem, chain_url)
 
-        # Flatten the chain
+        # Flatten the chain with an explicit stack (no per-node call frames);
+        # children are pushed reversed to keep the original preorder.
         names = []
-
-        def walk_chain(node):
-            species_name = node["species"]["name"]
-            names.append(species_name)
-            for evo in node.get("evolves_to", []):
-                walk_chain(evo)
-
-        walk_chain(data["chain"])
+        stack = [data["chain"]]
+        while stack:
+            node = stack.pop()
+            names.append(node["species"]["name"])
+            stack.extend(reversed(node.get("evolves_to", [])))
         return names
     except Exception:
         return []
 
 
+async def _fetch_species_row(client, sem, chain_tasks, species_info):
+    """Fetch one species' details, encounters and evolution chain; return a pokemon_metadata row."""
+    species = await _get_json(client, sem, species_info["url"])
+
+    pokedex_num = species["id"]
+    name = species["name"]
+    color = species.get("color", {}).get("name", "")
+    shape = species.get("shape", {}).get("name", "") if species.get("shape") else ""
+
+    # Get genus (English entry)
+    genus = ""
+    for g in species.get("genera", []):
+        if g.get("language", {}).get("name") == "en":
+            genus = g.get("genus", "")
+            break
+
+    # Get region and generation from Pokedex number
+    generation, region = get_region_generation(pokedex_num)
+
+    # Fetch encounters and the evolution chain concurrently
+    encounter_task = asyncio.create_task(fetch_first_encounter_location(client, sem, pokedex_num))
+
+    evo_chain_url = species.get("evolution_chain", {}).get("url", "")
+    if evo_chain_url:
+        # One shared task per chain URL so each chain is fetched only once
+        task = chain_tasks.get(evo_chain_url)
+        if task is None:
+            task = asyncio.create_task(fetch_evolution_chain(client, sem, evo_chain_url))
+            chain_tasks[evo_chain_url] = task
+        evo_chain = await task
+    else:
+        evo_chain = [name]
+
+    encounter_location = await encounter_task
+
+    return [
+        pokedex_num,
+        name,
+        region,
+        generation,
+        color,
+        shape,
+        genus,
+        encounter_location,
+        orjson.dumps(evo_chain).decode(),
+    ]
+
+
+async def _fetch_all_species_rows(all_species: list) -> list:
+    """Fetch details for every species concurrently and return pokemon_metadata rows."""
+    sem = asyncio.Semaphore(POKEAPI_CONCURRENCY)
+    chain_tasks = {}
+    done = 0
+
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=REQUEST_TIMEOUT,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+    ) as client:
+
+        async def one(species_info):
+            nonlocal done
+            try:
+                row = await _fetch_species_row(client, sem, chain_tasks, species_info)
+            except Exception as e:
+                print(f"\n  Warning: Failed to fetch {species_info['name']}: {e}")
+                row = None
+            done += 1
+            print(f"  [{done}/{len(all_species)}] species fetched", end="\r")
+            return row
+
+        results = await asyncio.gather(*(one(s) for s in all_species))
+
+    return [row for row in results if row is not None]
+
+
 def get_existing_pokemon_count(conn) -> int:
     """Check how many Pokemon are already in the metadata table."""
     result = conn.execute("SELECT COUNT(*) FROM pokemon_metadata").fetchone()
@@ -507,15 +787,17 @@ def ingest_pokemon_metadata(force: bool = False) -> int:
     print("Fetching Pokemon metadata from PokeAPI...")
 
     conn = get_connection()
+    tune_for_bulk_load(conn)
 
-    # First, get the total count of species
-    resp = httpx.get(
+    # The full species index fits in one response, so grab it in a single
+    # request instead of a count probe plus ~13 paginated fetches.
+    resp = HTTP.get(
         f"{POKEAPI_BASE}/pokemon-species",
-        params={"limit": 1},
-        timeout=REQUEST_TIMEOUT,
+        params={"limit": 100000},
     )
     resp.raise_for_status()
-    total_count = resp.json()["count"]
+    all_species = orjson.loads(resp.content)["results"]
+    total_count = len(all_species)
     print(f"  Found {total_count} Pokemon species")
 
     # Check if we already have all species (resume logic)
@@ -526,95 +808,20 @@ def ingest_pokemon_metadata(force: bool = False) -> int:
             conn.close()
             return existing
 
-    # Fetch all species in batches
-    all_species = []
-    offset = 0
-    batch_size = 100
-
-    while offset < total_count:
-        resp = httpx.get(
-            f"{POKEAPI_BASE}/pokemon-species",
-            params={"limit": batch_size, "offset": offset},
-            timeout=REQUEST_TIMEOUT,
-        )
-        resp.raise_for_status()
-        results = resp.json()["results"]
-        all_species.extend(results)
-        offset += batch_size
-        print(f"  Fetched species list: {len(all_species)}/{total_count}", end="\r")
-
+    # Fetch species details, encounters and evolution chains concurrently;
+    # the semaphore keeps us polite to PokeAPI.
+    rows = asyncio.run(_fetch_all_species_rows(all_species))
     print()
 
-    # Cache for evolution chains to avoid re-fetching
-    chain_cache = {}
-    ingested = 0
-
-    for i, species_info in enumerate(all_species, 1):
-        print(f"  [{i}/{len(all_species)}] {species_info['name']}...", end="\r")
-
-        try:
-            # Fetch individual species details
-            resp = httpx.get(species_info["url"], timeout=REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            species = resp.json()
-
-            pokedex_num = species["id"]
-            name = species["name"]
-            color = species.get("color", {}).get("name", "")
-            shape = species.get("shape", {}).get("name", "") if species.get("shape") else ""
-
-            # Get genus (English entry)
-            genus = ""
-            for g in species.get("genera", []):
-                if g.get("language", {}).get("name") == "en":
-                    genus = g.get("genus", "")
-                    break
-
-            # Get region and generation from Pokedex number
-            generation, region = get_region_generation(pokedex_num)
-
-            # Fetch first encounter location
-            encounter_location = fetch_first_encounter_location(pokedex_num)
-
-            # Fetch evolution chain (with caching)
-            evo_chain_url = species.get("evolution_chain", {}).get("url", "")
-            if evo_chain_url:
-                if evo_chain_url not in chain_cache:
-                    chain_cache[evo_chain_url] = fetch_evolution_chain(evo_chain_url)
-                evo_chain = chain_cache[evo_chain_url]
-            else:
-                evo_chain = [name]
-
-            # Store in database
-            conn.execute("""
-                INSERT OR REPLACE INTO pokemon_metadata
-                    (pokedex_number, name, region, generation, color, shape, genus, encounter_location, evolution_chain)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
-                pokedex_num,
-                name,
-                region,
-                generation,
-                color,
-                shape,
-                genus,
-                encounter_location,
-                json.dumps(evo_chain),
-            ])
-
-            ingested += 1
-
-            # Rate limit: PokeAPI is generous but let's be polite
-            if i % 20 == 0:
-                time.sleep(0.1)
-
-        except Exception as e:
-            print(f"\n  Warning: Failed to fetch {species_info['name']}: {e}")
-            continue
+    # One batched insert for the whole run instead of one per species.
+    if rows:
+        conn.begin()
+        conn.executemany(INSERT_POKEMON_SQL, rows)
+        conn.commit()
 
     conn.close()
-    print(f"\nDone! Ingested {ingested} Pokemon species.")
-    return ingested
+    print(f"\nDone! Ingested {len(rows)} Pokemon species.")
+    return len(rows)
 
 
 # ── Pocket ingestion ────────────────────────────────────────────────────
@@ -623,14 +830,12 @@ def ingest_pokemon_metadata(force: bool = False) -> int:
 def ingest_pocket_sets() -> None:
     """Fetch Pocket sets from the TCGdex API and upsert into pocket_sets."""
     print("Fetching Pocket sets...")
-    resp = httpx.get(f"{TCGDEX_API_BASE}/series/tcgp", timeout=REQUEST_TIMEOUT)
+    resp = HTTP.get(f"{TCGDEX_API_BASE}/series/tcgp")
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content)
 
     sets_list = data.get("sets", [])
-    conn = get_connection()
-    conn.execute("DELETE FROM pocket_sets")
-    count = 0
+    rows = []
     for s in sets_list:
         card_count_raw = s.get("cardCount", {})
         if isinstance(card_count_raw, dict):
@@ -638,28 +843,30 @@ def ingest_pocket_sets() -> None:
         else:
             card_count = int(card_count_raw) if card_count_raw else 0
 
-        conn.execute("""
-            INSERT INTO pocket_sets
-                (id, name, series, release_date, card_count, packs, logo_url)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, [
+        rows.append([
             s["id"],
             s.get("name", s["id"]),
             "tcgp",
             s.get("releaseDate", ""),
             card_count,
-            json.dumps([]),
+            orjson.dumps([]).decode(),
             "",
         ])
-        count += 1
 
+    conn = get_connection()
+    conn.begin()
+    conn.execute("DELETE FROM pocket_sets")
+    if rows:
+        conn.executemany(INSERT_POCKET_SET_SQL, rows)
+    conn.commit()
     conn.close()
-    print(f"  Saved {count} Pocket sets.")
+    print(f"  Saved {len(rows)} Pocket sets.")
 
 
 def ingest_pocket_cards(force: bool = False) -> int:
     """Fetch Pocket cards from the TCGdex API and upsert into pocket_cards."""
     conn = get_connection()
+    tune_for_bulk_load(conn)
 
     # Resume check
     if not force:
@@ -673,9 +880,9 @@ def ingest_pocket_cards(force: bool = False) -> int:
     print("Fetching Pocket cards from TCGdex...")
 
     # Get all sets in the tcgp series
-    resp = httpx.get(f"{TCGDEX_API_BASE}/series/tcgp", timeout=REQUEST_TIMEOUT)
+    resp = HTTP.get(f"{TCGDEX_API_BASE}/series/tcgp")
     resp.raise_for_status()
-    series_data = resp.json()
+    series_data = orjson.loads(resp.content)
     sets_list = series_data.get("sets", [])
     print(f"  Found {len(sets_list)} Pocket sets")
 
@@ -687,24 +894,24 @@ def ingest_pocket_cards(force: bool = False) -> int:
 
         # Fetch abbreviated card list for this set
         try:
-            set_resp = httpx.get(f"{TCGDEX_API_BASE}/sets/{set_id}", timeout=REQUEST_TIMEOUT)
+            set_resp = HTTP.get(f"{TCGDEX_API_BASE}/sets/{set_id}")
             set_resp.raise_for_status()
-            set_data = set_resp.json()
+            set_data = orjson.loads(set_resp.content)
         except Exception as e:
             print(f"failed ({e})")
             continue
 
         cards_brief = set_data.get("cards", [])
-        set_ingested = 0
+        rows = []
 
         for card_brief in cards_brief:
             card_id = card_brief["id"]
 
             # Fetch full card data
             try:
-                card_resp = httpx.get(f"{TCGDEX_API_BASE}/cards/{card_id}", timeout=REQUEST_TIMEOUT)
+                card_resp = HTTP.get(f"{TCGDEX_API_BASE}/cards/{card_id}")
                 card_resp.raise_for_status()
-                card = card_resp.json()
+                card = orjson.loads(card_resp.content)
             except Exception as e:
                 print(f"\n    Warning: Failed to fetch {card_id}: {e}")
                 time.sleep(0.05)
@@ -741,13 +948,7 @@ def ingest_pocket_cards(force: bool = False) -> int:
             image_base = card.get("image", "")
             image_url = f"{image_base}/high.webp" if image_base else ""
 
-            conn.execute("""
-                INSERT INTO pocket_cards
-                    (id, name, set_id, number, rarity, card_type, element, hp,
-                     stage, retreat_cost, weakness, evolves_from, packs,
-                     image_url, image_filename, illustrator, raw_data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
+            rows.append([
                 card_id,
                 card.get("name", ""),
                 set_id,
@@ -760,17 +961,22 @@ def ingest_pocket_cards(force: bool = False) -> int:
                 card.get("retreat"),
                 weakness,
                 card.get("evolveFrom", ""),
-                json.dumps(packs),
+                orjson.dumps(packs).decode(),
                 image_url,
                 "",
                 card.get("illustrator", ""),
-                json.dumps(card),
+                orjson.dumps(card).decode(),
             ])
-            set_ingested += 1
             time.sleep(0.05)
 
-        ingested += set_ingested
-        print(f"{set_ingested} cards")
+        # One batched insert per set (same pattern as tcg_cards)
+        if rows:
+            conn.begin()
+            conn.executemany(INSERT_POCKET_CARD_SQL, rows)
+            conn.commit()
+
+        ingested += len(rows)
+        print(f"{len(rows)} cards")
 
     conn.close()
     print(f"  Saved {ingested} Pocket cards.")